@@ -2,18 +2,102 @@
 API client for the Remote Patient Monitoring application
 """
 
+import time
+from collections import namedtuple
+from functools import lru_cache
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import BASE_URL, REQUEST_TIMEOUT, HTTP_POOL_SIZE, CACHE_TTL
+
+# One keep-alive session shared by the refresh timer and message sends,
+# so repeated calls reuse the TCP/TLS connection instead of reconnecting.
+# requests advertises gzip, deflate and, with brotli installed, br itself.
+_session = requests.Session()
+_session.headers.update({"Accept": "application/json", "Connection": "keep-alive"})
+_session.mount("https://", HTTPAdapter(
+    pool_connections=HTTP_POOL_SIZE,
+    pool_maxsize=HTTP_POOL_SIZE,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+))
+
+# One SpO2 reading; parsed once here so the UI reads fields by position
+# rather than looking up dict keys for every row
+Measurement = namedtuple("Measurement", ["timestamp", "spo2"])
+
+# Conditional request headers built from the last ETag/Last-Modified
+# returned for each patient
+_validators = {}
+
+# Last record fetched for each patient as (fetched_at, data)
+_cache = {}
 
-from config import BASE_URL
 
+@lru_cache(maxsize=None)
+def _patient_url(patient_id):
+    """Return the API endpoint for a patient, formatted once per patient"""
+    return BASE_URL.format(patient_id)
 
-def fetch_patient_data(patient_id):
+
+def fetch_patient_data(patient_id, only_if_changed=False, use_cache=True):
     """
     Fetch patient data from the API
+
+    With only_if_changed, the last ETag or Last-Modified seen for the patient
+    is sent back as If-None-Match/If-Modified-Since and None is returned if
+    the server replies 304 Not Modified.
+    Records fetched less than CACHE_TTL seconds ago are served from memory
+    unless use_cache is false.
+    The record's measurements are returned as Measurement tuples.
     """
-    response = requests.get(BASE_URL.format(patient_id))
+    now = time.monotonic()
+    cached = _cache.get(patient_id)
+    if use_cache and cached and now - cached[0] < CACHE_TTL:
+        return None if only_if_changed else cached[1]
+
+    headers = _validators.get(patient_id) if only_if_changed else None
+    response = _session.get(_patient_url(patient_id), headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 304:
+        _cache[patient_id] = (now, cached[1])
+        return None
     response.raise_for_status()
-    return response.json()
+
+    data = orjson.loads(response.content)
+    data["measurements"] = [
+        Measurement(m.get("timestamp", ""), m.get("spo2", 0))
+        for m in data.get("measurements", [])
+    ]
+
+    # Validators are only kept with the record they describe, so a body that
+    # fails to parse cannot make a later 304 vouch for an older record
+    validators = {}
+    if "ETag" in response.headers:
+        validators["If-None-Match"] = response.headers["ETag"]
+    if "Last-Modified" in response.headers:
+        validators["If-Modified-Since"] = response.headers["Last-Modified"]
+    _validators[patient_id] = validators
+    _cache[patient_id] = (now, data)
+    return data
+
+
+def get_cached_patient_data(patient_id):
+    """
+    Return the last record fetched for a patient, however old, or None
+    """
+    cached = _cache.get(patient_id)
+    return cached[1] if cached else None
+
+
+def expire_patient_data(patient_id):
+    """
+    Make the next fetch for a patient go to the API, keeping its last record
+    """
+    cached = _cache.get(patient_id)
+    if cached:
+        _cache[patient_id] = (float("-inf"), cached[1])
 
 
 def send_patient_message(patient_id, message):
@@ -21,9 +105,21 @@ def send_patient_message(patient_id, message):
     Send a message to a patient
     """
     payload = {"message": message}
-    response = requests.post(
-        BASE_URL.format(patient_id),
-        json=payload
+    response = _session.post(
+        _patient_url(patient_id),
+        data=orjson.dumps(payload),
+        headers={"Content-Type": "application/json"},
+        timeout=REQUEST_TIMEOUT
     )
     response.raise_for_status()
-    return response.json()
+
+    # The message may change the record, so do not serve it from the cache
+    expire_patient_data(patient_id)
+    return orjson.loads(response.content)
+
+
+def close_session():
+    """
+    Close the shared HTTP session and its pooled connections
+    """
+    _session.close()
@@ -2,11 +2,44 @@
 Configuration settings for the Remote Patient Monitoring application
 """
 
+from enum import IntEnum
+
 # API endpoint
 BASE_URL = "https://disp.yxl.ch/rpm/patients/{}"
 
+# HTTP timeouts in seconds (connect, read)
+REQUEST_TIMEOUT = (3, 10)
+
+# Pooled connections to the API host, also the number of concurrent API workers
+HTTP_POOL_SIZE = 4
+
+# Seconds a fetched patient record is reused for patient switches and
+# prefetches before the API is asked again; refresh ticks always revalidate
+CACHE_TTL = 25
+
+# Auto-refresh intervals in milliseconds: the base interval backs off
+# towards the maximum while readings stay normal, and drops to the
+# warning interval while any reading is low
+REFRESH_INTERVAL = 30000
+WARNING_REFRESH_INTERVAL = 10000
+MAX_REFRESH_INTERVAL = 300000
+
+# Retry delay in milliseconds after a failed fetch, doubled for each
+# consecutive failure up to MAX_REFRESH_INTERVAL
+ERROR_RETRY_INTERVAL = 1000
+
 # Valid patient IDs
 VALID_PATIENTS = [1, 2, 3, 10, 42]
 
+# Valid patient IDs in the order they are offered for selection
+SORTED_PATIENTS = tuple(sorted(VALID_PATIENTS))
+
 # SpO2 threshold for warnings
 SPO2_THRESHOLD = 95
+
+
+class Status(IntEnum):
+    """Overall patient status derived from the SpO2 readings"""
+    UNKNOWN = 0
+    OK = 1
+    WARNING = 2
@@ -7,10 +7,55 @@ from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QComboBox,
     QPushButton, QLabel, QTextEdit, QGroupBox, QFrame,
-    QMessageBox, QTableWidget, QAbstractItemView
+    QMessageBox, QTableView, QAbstractItemView
 )
 
-from config import VALID_PATIENTS, SPO2_THRESHOLD
+from config import SORTED_PATIENTS, SPO2_THRESHOLD
+from ui.measurements_model import MeasurementsModel
+from ui.style import table_item_style
+
+
+# Label fonts, built once and shared by the widgets that use them
+TITLE_FONT = QFont()
+TITLE_FONT.setPointSize(18)
+TITLE_FONT.setBold(True)
+
+SUBTITLE_FONT = QFont()
+SUBTITLE_FONT.setPointSize(10)
+
+BOLD_FONT = QFont()
+BOLD_FONT.setBold(True)
+
+STATUS_FONT = QFont()
+STATUS_FONT.setPointSize(16)
+STATUS_FONT.setBold(True)
+
+# Message box icon to the severity property used by the stylesheet
+SEVERITY_NAMES = {
+    QMessageBox.Icon.Critical: "critical",
+    QMessageBox.Icon.Warning: "warning",
+}
+
+# Contents margins of the layouts inside group boxes, clearing the title
+GROUP_MARGINS = (15, 20, 15, 15)
+
+
+def _vbox(widget, margins=(0, 0, 0, 0), spacing=None):
+    """Create a vertical layout on widget with the given margins and spacing"""
+    return _box_layout(QVBoxLayout(widget), margins, spacing)
+
+
+def _hbox(widget, margins=(0, 0, 0, 0), spacing=None):
+    """Create a horizontal layout on widget with the given margins and spacing"""
+    return _box_layout(QHBoxLayout(widget), margins, spacing)
+
+
+def _box_layout(layout, margins, spacing):
+    """Apply margins and, unless None, spacing to a new layout"""
+    layout.setContentsMargins(*margins)
+    if spacing is not None:
+        layout.setSpacing(spacing)
+    return layout
 
 
 class UIComponents:
@@ -21,127 +66,50 @@ class UIComponents:
     @staticmethod
     def setup_header(parent):
         header_widget = QWidget()
-        header_layout = QHBoxLayout(header_widget)
-        header_layout.setContentsMargins(0, 0, 0, 15)
+        header_layout = _hbox(header_widget, (0, 0, 0, 15))
 
         title_area = QWidget()
-        title_layout = QVBoxLayout(title_area)
-        title_layout.setContentsMargins(0, 0, 0, 0)
-        title_layout.setSpacing(5)
+        title_layout = _vbox(title_area, spacing=5)
 
         title_label = QLabel("Remote Patient Monitoring")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setStyleSheet("color: #051d40;")
+        title_label.setFont(TITLE_FONT)
+        title_label.setObjectName("titleLabel")
 
         subtitle_label = QLabel("Real-time SpO2 monitoring system")
-        subtitle_font = QFont()
-        subtitle_font.setPointSize(10)
-        subtitle_label.setFont(subtitle_font)
-        subtitle_label.setStyleSheet("color: #6c757d;")
+        subtitle_label.setFont(SUBTITLE_FONT)
+        subtitle_label.setObjectName("subtitleLabel")
 
         title_layout.addWidget(title_label)
         title_layout.addWidget(subtitle_label)
 
         selection_area = QWidget()
-        selection_area.setStyleSheet("""
-            QWidget {
-                background-color: #f8f9fa;
-                border-radius: 8px;
-                border: 1px solid #e9ecef;
-            }
-        """)
-        selection_layout = QHBoxLayout(selection_area)
-        selection_layout.setContentsMargins(15, 10, 15, 10)
-        selection_layout.setSpacing(10)
+        selection_area.setObjectName("selectionArea")
+        selection_layout = _hbox(selection_area, (15, 10, 15, 10), 10)
 
         patient_label = QLabel("Patient:")
         patient_label.setFixedWidth(60)
-        font = QFont()
-        font.setBold(True)
-        patient_label.setFont(font)
+        patient_label.setFont(BOLD_FONT)
 
         parent.combobox_patient = QComboBox()
         parent.combobox_patient.setCursor(Qt.PointingHandCursor)
-        parent.combobox_patient.setStyleSheet("""
-            QComboBox {
-                border: 1px solid #ced4da;
-                border-radius: 0px;
-                padding: 1px 18px 1px 3px;
-                background-color: white;
-                color: #1a1a1a;
-                min-width: 150px;
-                font-size: 11px;
-                combobox-popup: 0;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left: 1px solid #ced4da;
-            }
-            QComboBox:on {
-                /* Keine border-radius Definition mehr nötig */
-            }
-            QComboBox QAbstractItemView {
-                border: 1px solid #ced4da;
-                selection-background-color: #e9ecef;
-                selection-color: #212121;
-                background-color: white;
-                color: #1a1a1a;
-                font-size: 11px;
-                outline: 0;
-                padding: 0px 2px;  /* Kein Padding oben/unten, nur links/rechts */
-                margin: 0px;
-                border-radius: 0px;
-            }
-            QComboBox QAbstractItemView::item {
-                background-color: white;
-                color: #1a1a1a;
-                padding: 2px 5px;
-                margin: 0px;
-                border: none;
-                height: 18px;
-                min-height: 18px;
-            }
-            QComboBox QAbstractItemView::item:selected {
-                background-color: #e9ecef;
-                color: #212121;
-            }
-        """)
-
-        for patient_id in sorted(VALID_PATIENTS):
-            parent.combobox_patient.addItem(f"Patient {patient_id}", userData=patient_id)
+        parent.combobox_patient.setObjectName("patientCombo")
+
+        # Add all entries in one call; the id is attached to each afterwards
+        parent.combobox_patient.addItems([f"Patient {patient_id}" for patient_id in SORTED_PATIENTS])
+        for index, patient_id in enumerate(SORTED_PATIENTS):
+            parent.combobox_patient.setItemData(index, patient_id)
 
         if parent.combobox_patient.count() > 0:
             parent.combobox_patient.setCurrentIndex(0)
-            parent.current_patient = parent.combobox_patient.currentData()
+            parent.current_patient = parent.selected_patient = parent.combobox_patient.currentData()
 
         parent.combobox_patient.currentIndexChanged.connect(parent.on_patient_changed)
 
         parent.refresh_button = QPushButton("Refresh")
         parent.refresh_button.setFixedWidth(100)
         parent.refresh_button.setCursor(Qt.PointingHandCursor)
-        parent.refresh_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0d6efd;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0b5ed7;
-            }
-            QPushButton:disabled {
-                background-color: #8cadf3;
-                color: #ffffff;
-            }
-        """)
-        parent.refresh_button.clicked.connect(parent.fetch_patient_data)
+        parent.refresh_button.setObjectName("refreshButton")
+        parent.refresh_button.clicked.connect(parent.refresh_patient_data)
 
         selection_layout.addWidget(patient_label)
         selection_layout.addWidget(parent.combobox_patient)
@@ -153,11 +121,7 @@ class UIComponents:
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
         separator.setFrameShadow(QFrame.Sunken)
-        separator.setStyleSheet("""
-            background-color: #dee2e6;
-            margin-top: 5px;
-            margin-bottom: 5px;
-        """)
+        separator.setObjectName("headerSeparator")
 
         parent.main_layout.addWidget(header_widget)
         parent.main_layout.addWidget(separator)
@@ -167,36 +131,28 @@ class UIComponents:
     @staticmethod
     def setup_data_view(parent):
         data_widget = QWidget()
-        data_layout = QVBoxLayout(data_widget)
-        data_layout.setContentsMargins(0, 0, 0, 0)
-        data_layout.setSpacing(10)
+        data_layout = _vbox(data_widget, spacing=10)
 
         parent.patient_info = QLabel("Loading patient data...")
-        parent.patient_info.setStyleSheet("""
-            background-color: #e8f4ff;
-            padding: 10px;
-            border-radius: 8px;
-            border: 1px solid #c8e1ff;
-            font-size: 14px;
-            font-weight: bold;
-        """)
+        parent.patient_info.setObjectName("patientInfo")
         parent.patient_info.setAlignment(Qt.AlignCenter)
         data_layout.addWidget(parent.patient_info)
 
         parent.table_group = QGroupBox("SpO2 Readings")
-        table_layout = QVBoxLayout(parent.table_group)
-        table_layout.setContentsMargins(15, 20, 15, 15)
+        table_layout = _vbox(parent.table_group, GROUP_MARGINS)
 
-        parent.table = QTableWidget(0, 3)
-        parent.table.setHorizontalHeaderLabels(["Time", "SpO2 (%)", "Status"])
+        parent.table = QTableView()
+        parent.table_model = MeasurementsModel(parent.table)
+        parent.table.setModel(parent.table_model)
         parent.table.horizontalHeader().setStretchLastSection(True)
         parent.table.verticalHeader().setVisible(False)
 
         parent.table.setSelectionMode(QAbstractItemView.NoSelection)
-        parent.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        parent.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         parent.table.setAlternatingRowColors(False)
         parent.table.setShowGrid(False)
         parent.table.setFocusPolicy(Qt.NoFocus)
+        parent.table.setStyleSheet(table_item_style)
 
         table_layout.addWidget(parent.table)
         data_layout.addWidget(parent.table_group)
@@ -208,39 +164,32 @@ class UIComponents:
     @staticmethod
     def setup_status_message_view(parent):
         status_widget = QWidget()
-        status_layout = QVBoxLayout(status_widget)
-        status_layout.setContentsMargins(0, 0, 0, 0)
-        status_layout.setSpacing(15)
+        status_layout = _vbox(status_widget, spacing=15)
 
         parent.status_group = QGroupBox("Patient Status")
-        status_group_layout = QVBoxLayout(parent.status_group)
-        status_group_layout.setContentsMargins(15, 20, 15, 15)
+        status_group_layout = _vbox(parent.status_group, GROUP_MARGINS)
 
         parent.status_label = QLabel("Status: Unknown")
         parent.status_label.setAlignment(Qt.AlignCenter)
-        font = QFont()
-        font.setBold(True)
-        font.setPointSize(16)
-        parent.status_label.setFont(font)
+        parent.status_label.setFont(STATUS_FONT)
 
         status_group_layout.addWidget(parent.status_label)
         status_layout.addWidget(parent.status_group)
 
         parent.message_group = QGroupBox("Clinical Advice")
-        message_layout = QVBoxLayout(parent.message_group)
-        message_layout.setContentsMargins(15, 20, 15, 15)
-        message_layout.setSpacing(10)
+        message_layout = _vbox(parent.message_group, GROUP_MARGINS, 10)
 
         message_info = QLabel(
             f"When SpO2 levels are below {SPO2_THRESHOLD}%, you can send clinical advice to the patient:")
         message_info.setWordWrap(True)
-        message_info.setStyleSheet("color: #6c757d;")
+        message_info.setObjectName("messageInfo")
 
         parent.message_text = QTextEdit()
         parent.message_text.setPlaceholderText("Enter clinical advice for the patient...")
         parent.message_text.setEnabled(False)
 
         parent.send_button = QPushButton("Send Advice")
+        parent.send_button.setObjectName("sendButton")
         parent.send_button.setCursor(Qt.PointingHandCursor)
         parent.send_button.clicked.connect(parent.send_message)
         parent.send_button.setEnabled(False)
@@ -258,39 +207,17 @@ class UIComponents:
 
     @staticmethod
     def create_message_box(parent, title, text, info_text, icon_type=QMessageBox.Icon.Information):
-        msg = QMessageBox(parent)
+        # Each icon gets one box on the parent, which later calls re-texts
+        msg = parent.message_boxes.get(icon_type)
+        if msg is None:
+            msg = QMessageBox(parent)
+            msg.setIcon(icon_type)
+            # Styled by the application stylesheet through the severity property
+            msg.setProperty("severity", SEVERITY_NAMES.get(icon_type, "information"))
+            parent.message_boxes[icon_type] = msg
+
         msg.setWindowTitle(title)
         msg.setText(text)
         msg.setInformativeText(info_text)
-        msg.setIcon(icon_type)
-
-        if icon_type in [QMessageBox.Icon.Critical, QMessageBox.Icon.Warning]:
-            button_style = """
-                background-color: #1a1a1a;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 12px;
-            """
-        else:
-            button_style = """
-                background-color: #7bb9ff;
-                color: black;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 12px;
-            """
-
-        msg.setStyleSheet(f"""
-            QMessageBox {{
-                background-color: white;
-            }}
-            QMessageBox QLabel {{
-                color: #1a1a1a;
-            }}
-            QPushButton {{
-                {button_style}
-            }}
-        """)
 
         return msg
@@ -2,16 +2,25 @@
 Main window for the Remote Patient Monitoring application
 """
 
-from datetime import datetime
-
-from PySide6.QtCore import QTimer
-from PySide6.QtGui import QColor, QFont
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTableWidgetItem, QMessageBox, QStatusBar
-
-from api.patient_data import fetch_patient_data, send_patient_message
-from config import SPO2_THRESHOLD
+import random
+import time
+
+from PySide6.QtCore import Qt, QEvent, QTimer, QThreadPool
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QMessageBox, QStatusBar
+
+from api.patient_data import (
+    fetch_patient_data, send_patient_message, get_cached_patient_data, expire_patient_data, close_session
+)
+from config import (
+    VALID_PATIENTS, HTTP_POOL_SIZE, REFRESH_INTERVAL, WARNING_REFRESH_INTERVAL, MAX_REFRESH_INTERVAL,
+    ERROR_RETRY_INTERVAL, Status
+)
 from ui.components import UIComponents
-from ui.style import get_application_styles, button_style
+from ui.style import (
+    get_application_styles, status_unknown_style, status_ok_style, status_warning_style,
+    message_group_style, message_group_warning_style, patient_info_error_style
+)
+from ui.workers import ApiWorker
 
 
 class RPMApp(QMainWindow):
@@ -25,8 +34,26 @@ class RPMApp(QMainWindow):
         self.setWindowTitle("Remote Patient Monitoring")
         self.resize(800, 600)
         self.current_patient = None
+        # Patient chosen in the combo box, cached on each selection change
+        self.selected_patient = None
         self.measurements = []
-        self.status = "Unknown"
+        self.status = Status.UNKNOWN
+        self._shown_status = None
+        self._inflight = False
+        self._fetch_worker = None
+        self._fetch_polled = False
+        self._stable_polls = 0
+        # Adaptive refresh interval, kept apart from any error retry delay
+        # the timer may be running with
+        self._refresh_interval = REFRESH_INTERVAL
+        self._consecutive_errors = 0
+        self._displayed_patient = None
+        self._message_patient = None
+        self._sending = False
+        # One reusable message box per icon, see UIComponents.create_message_box
+        self.message_boxes = {}
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(HTTP_POOL_SIZE)
 
         self.setStyleSheet(get_application_styles())
 
@@ -54,191 +81,288 @@ class RPMApp(QMainWindow):
 
         # Setup status bar
         self.status_bar = QStatusBar()
-        self.status_bar.setStyleSheet("QStatusBar { background-color: #f8f9fa; color: #495057; }")
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
 
-        # Initialize
-        self.combobox_patient.setCurrentIndex(0)
+        # Initialize; warming the other patients waits until the event loop
+        # has painted the window
         self.fetch_patient_data()
+        QTimer.singleShot(0, self.prefetch_patients)
 
-        # Setup auto-refresh
+        # Setup auto-refresh; a coarse timer lets the OS batch the wakeups
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self.fetch_patient_data)
-        self.timer.start(30000)  # Refresh every 30 seconds
+        self.timer.setTimerType(Qt.VeryCoarseTimer)
+        self.timer.timeout.connect(self.poll_patient_data)
+        self.timer.start(REFRESH_INTERVAL)
+
+    def showEvent(self, event):
+        """Resume polling when the window becomes visible again"""
+        super().showEvent(event)
+        self.resume_refresh()
+
+    def hideEvent(self, event):
+        """Stop polling while the window is hidden"""
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def changeEvent(self, event):
+        """Stop polling while the window is minimized"""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.timer.stop()
+            elif self.isVisible():
+                self.resume_refresh()
+
+    def resume_refresh(self):
+        """Restart the refresh timer, fetching at once if polling was paused"""
+        if not self.timer.isActive():
+            self.timer.start()
+            self.poll_patient_data()
+
+    def schedule_refresh(self, changed=True, polled=True):
+        """Poll faster while the patient is in warning and back off while stable"""
+        if self.status is Status.WARNING:
+            self._stable_polls = 0
+            interval = WARNING_REFRESH_INTERVAL
+        elif not changed:
+            # Nothing new since the last poll, so back off faster; a switch
+            # served from the cache or a manual refresh says nothing about
+            # how often the patient's readings change
+            if polled:
+                interval = min(MAX_REFRESH_INTERVAL, self._refresh_interval * 2)
+            else:
+                interval = self._refresh_interval
+        else:
+            interval = min(MAX_REFRESH_INTERVAL, REFRESH_INTERVAL * (1 + self._stable_polls // 2))
+            self._stable_polls += 1
+
+        self._refresh_interval = interval
+        if interval != self.timer.interval():
+            self.timer.setInterval(interval)
+
+    def closeEvent(self, event):
+        """Stop polling and release pooled connections when the window closes"""
+        self.timer.stop()
+        close_session()
+        super().closeEvent(event)
 
-    def on_patient_changed(self):
+    def on_patient_changed(self, index):
         """Handle patient selection changes"""
+        patient_id = self.selected_patient = self.combobox_patient.itemData(index)
+        if self._inflight and self.thread_pool.tryTake(self._fetch_worker):
+            # The previous patient's fetch was still queued, so drop it
+            # rather than wait for a result that would be discarded
+            self._inflight = False
+        # A new patient starts again from the base refresh interval
+        self._stable_polls = 0
+        self._refresh_interval = REFRESH_INTERVAL
+        # Show the last known readings right away while they are refreshed
+        data = get_cached_patient_data(patient_id)
+        if data is not None and not self._inflight:
+            self.current_patient = patient_id
+            try:
+                self.show_patient_data(patient_id, data)
+            except Exception as e:
+                # Ask the API again rather than re-serve the cached record
+                expire_patient_data(patient_id)
+                self._report_fetch_error(str(e))
+        # No advice until the selected patient's readings are on screen
+        self.update_advice_controls()
         self.fetch_patient_data()
 
-    def fetch_patient_data(self):
-        """Fetch and display patient data"""
-        try:
-            patient_id = self.combobox_patient.currentData()
-            if patient_id is None:
-                return
+    def prefetch_patients(self):
+        """Warm the API cache for the other patients so switching is instant"""
+        for patient_id in VALID_PATIENTS:
+            if patient_id != self.current_patient:
+                self.thread_pool.start(ApiWorker(fetch_patient_data, patient_id))
 
-            self.current_patient = patient_id
-            self.refresh_button.setEnabled(False)
-            self.refresh_button.setText("Loading...")
-            self.status_bar.showMessage("Fetching data...")
-            self.patient_info.setText(f"Loading data for Patient {patient_id}...")
-
-            data = fetch_patient_data(patient_id)
-            self.measurements = data.get("measurements", [])
-
-            # Update patient info display
-            if self.measurements:
-                self.patient_info.setText(
-                    f"Patient {patient_id}"
-                )
-            else:
-                self.patient_info.setText(f"Patient {patient_id} - No data available")
+    def refresh_patient_data(self):
+        """Fetch the selected patient on request, bypassing the response cache"""
+        expire_patient_data(self.selected_patient)
+        self.fetch_patient_data()
 
-            self.update_table()
-            self.update_status()
+    def poll_patient_data(self):
+        """Revalidate the selected patient with the API on a refresh tick"""
+        self.fetch_patient_data(poll=True)
 
-            self.refresh_button.setText("Refresh")
-            self.refresh_button.setEnabled(True)
-            self.send_button.setStyleSheet(button_style)
-            self.status_bar.showMessage(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    def fetch_patient_data(self, poll=False):
+        """Fetch patient data in the background"""
+        patient_id = self.selected_patient
+        if patient_id is None or self._inflight:
+            return
+
+        self._inflight = True
+        self._fetch_polled = poll
+        self.current_patient = patient_id
+        self.refresh_button.setEnabled(False)
+        self.refresh_button.setText("Loading...")
+        self.status_bar.showMessage("Fetching data...")
+        self.patient_info.setText(f"Loading data for Patient {patient_id}...")
+
+        # Only ask for changes when the table already shows this patient
+        only_if_changed = patient_id == self._displayed_patient
+        # Refresh ticks skip the response cache, so the warning interval
+        # really reaches the API; the conditional request keeps them cheap
+        worker = ApiWorker(fetch_patient_data, patient_id, only_if_changed, not poll)
+        worker.signals.finished.connect(self._on_fetch_done)
+        worker.signals.error.connect(self._on_fetch_error)
+        # Kept alive by this reference rather than deleted by the pool once
+        # it has run, so a later tryTake never reaches a freed runnable
+        worker.setAutoDelete(False)
+        self._fetch_worker = worker
+        # Run ahead of any queued prefetches for the other patients
+        self.thread_pool.start(worker, 1)
+
+    def _finish_fetch(self):
+        """Reset the fetch state; return False if the selection changed meanwhile"""
+        self._inflight = False
+        self.refresh_button.setText("Refresh")
+        self.refresh_button.setEnabled(True)
+
+        if self.selected_patient != self.current_patient:
+            self.fetch_patient_data()
+            return False
+        return True
+
+    def _on_fetch_done(self, data):
+        """Display patient data delivered by the fetch worker"""
+        if not self._finish_fetch():
+            return
 
+        patient_id = self.current_patient
+
+        try:
+            # None means the server reported no changes since the last fetch
+            changed = data is not None and self.show_patient_data(patient_id, data)
         except Exception as e:
-            msg = UIComponents.create_message_box(
-                self,
-                "Error",
-                "Could not fetch patient data",
-                str(e),
-                QMessageBox.Icon.Critical
+            # Do not trust what is on screen; the next fetch redraws in full
+            self._displayed_patient = None
+            self.update_advice_controls()
+            self._report_fetch_error(str(e))
+            return
+
+        if self._consecutive_errors:
+            # Back from an error: drop the error styling on the patient info
+            # and leave the retry delay for the adaptive interval
+            self.patient_info.setStyleSheet("")
+            self.timer.setInterval(self._refresh_interval)
+            self._consecutive_errors = 0
+
+        # Update patient info display
+        if self.measurements:
+            self.patient_info.setText(
+                f"Patient {patient_id}"
             )
-            msg.exec_()
+        else:
+            self.patient_info.setText(f"Patient {patient_id} - No data available")
+
+        self.schedule_refresh(changed, self._fetch_polled)
+        self.status_bar.showMessage(f"Last updated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    def show_patient_data(self, patient_id, data):
+        """Render a patient record; return False if it matched what is shown"""
+        measurements = data.get("measurements", [])
+        same_patient = patient_id == self._displayed_patient
+        if same_patient and measurements == self.measurements:
+            return False
+
+        # Rows already on screen are kept when the history only grew
+        grew = same_patient and measurements[:len(self.measurements)] == self.measurements
+        first_new_row = len(self.measurements) if grew else 0
+
+        # Only a record that made it into the table becomes the displayed one
+        self.update_table(measurements, first_new_row)
+        self.measurements = measurements
+        self._displayed_patient = patient_id
+        self.update_status()
+        self.update_advice_controls()
+        return True
+
+    def _on_fetch_error(self, error):
+        """Report a failed fetch in the status bar and retry with backoff"""
+        if self._finish_fetch():
+            self._report_fetch_error(error)
+
+    def _report_fetch_error(self, error):
+        """Show a fetch or display error and schedule a retry with backoff"""
+        # Back off exponentially with jitter so an outage is not polled at
+        # the regular rate, and report it without a blocking dialog
+        delay = min(
+            MAX_REFRESH_INTERVAL,
+            ERROR_RETRY_INTERVAL * 2 ** self._consecutive_errors + random.randint(0, 500)
+        )
+        if not self._consecutive_errors:
+            # Only the first failure in a row needs to restyle the label
+            self.patient_info.setStyleSheet(patient_info_error_style)
+        self._consecutive_errors += 1
+        if self.timer.isActive():
+            self.timer.start(delay)
+        else:
+            self.timer.setInterval(delay)
 
-            self.refresh_button.setText("Refresh")
-            self.refresh_button.setEnabled(True)
-            self.status_bar.showMessage(f"Error fetching data: {str(e)}")
-            patient_id = self.combobox_patient.currentData()
-            self.patient_info.setText(f"Error loading data for Patient {patient_id}")
-            self.patient_info.setStyleSheet("""
-                background-color: #ffebee;
-                padding: 10px;
-                border-radius: 8px;
-                border: 1px solid #ffcdd2;
-                font-size: 14px;
-                font-weight: bold;
-                color: #d32f2f;
-            """)
-
-    def update_table(self):
-        """Update the SpO2 readings table"""
-        self.table.setStyleSheet("""
-            QTableWidget::item {
-                background-color: transparent !important;
-                border: none;
-            }
-        """)
-        self.table.setRowCount(0)
-
-        for measurement in self.measurements:
-            timestamp = measurement.get("timestamp", "")
-            spo2 = measurement.get("spo2", 0)
-
-            row_position = self.table.rowCount()
-            self.table.insertRow(row_position)
-
-            # Format time
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            formatted_time = dt.strftime("%H:%M, %d %b")
-
-            time_item = QTableWidgetItem(formatted_time)
-            spo2_item = QTableWidgetItem(str(spo2))
-
-            status_text = "NORMAL" if spo2 >= SPO2_THRESHOLD else "LOW"
-            status_item = QTableWidgetItem(status_text)
-            status_item.setFont(QFont("", -1, QFont.Bold))
-
-            # Set color based on status
-            if status_text == "NORMAL":
-                status_item.setBackground(QColor("#e8f5e9"))
-                status_item.setForeground(QColor("#2e7d32"))
-            else:
-                status_item.setBackground(QColor("#ffebee"))
-                status_item.setForeground(QColor("#d32f2f"))
+        self.status_bar.showMessage(f"Error fetching data: {error} (retrying in {delay // 1000} s)")
+        self.patient_info.setText(f"Error loading data for Patient {self.current_patient}")
 
-            # Add to table → jetzt NUR EINMAL setzen
-            self.table.setItem(row_position, 0, time_item)
-            self.table.setItem(row_position, 1, spo2_item)
-            self.table.setItem(row_position, 2, status_item)
+    def update_table(self, measurements, first_row=0):
+        """Update the SpO2 readings table, rebuilding rows from first_row onwards"""
+        # Load rows and resize columns as one paint rather than one per step
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table_model.set_measurements(measurements, first_row)
 
-        self.table.resizeColumnsToContents()
-        self.table.setColumnWidth(0, max(150, self.table.columnWidth(0)))
-        self.table.repaint()
+            self.table.resizeColumnsToContents()
+            self.table.setColumnWidth(0, max(150, self.table.columnWidth(0)))
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def update_status(self):
         """Update the overall patient status display"""
         if not self.measurements:
-            self.status = "Unknown"
-            self.status_label.setText("Status: Unknown")
-            self.status_label.setStyleSheet("""
-                color: #6c757d; 
-                background-color: #f8f9fa; 
-                padding: 10px; 
-                border-radius: 8px;
-            """)
-            self.message_text.setEnabled(False)
-            self.send_button.setEnabled(False)
-            self.message_group.setStyleSheet("QGroupBox { background-color: white; }")
-            return
+            status = Status.UNKNOWN
+        elif self.table_model.has_low_reading:
+            status = Status.WARNING
+        else:
+            status = Status.OK
 
-        # Check if any reading is below threshold
-        low_reading = False
-        for measurement in self.measurements:
-            spo2 = measurement.get("spo2", 0)
-            if spo2 < SPO2_THRESHOLD:
-                low_reading = True
-                break
+        # Restyling is only needed when the status actually changes
+        if status is self._shown_status:
+            return
+        self.status = self._shown_status = status
 
-        if low_reading:
-            self.status = "Warning"
+        if status is Status.UNKNOWN:
+            self.status_label.setText("Status: Unknown")
+            self.status_label.setStyleSheet(status_unknown_style)
+            self.message_group.setStyleSheet(message_group_style)
+        elif status is Status.WARNING:
             self.status_label.setText("WARNING")
-            self.status_label.setStyleSheet("""
-                color: #721c24;
-                background-color: #f8d7da;
-                padding: 15px;
-                border-radius: 8px;
-                font-weight: bold;
-                border: 1px solid #f5c6cb;
-            """)
-            self.message_text.setEnabled(True)
-            self.send_button.setEnabled(True)
+            self.status_label.setStyleSheet(status_warning_style)
             # Highlight the message group when warning is active
-            self.message_group.setStyleSheet("""
-                QGroupBox {
-                    background-color: #fff8f8;
-                    border: 1px solid #f5c6cb;
-                }
-                QGroupBox::title {
-                    color: #721c24;
-                }
-            """)
+            self.message_group.setStyleSheet(message_group_warning_style)
         else:
-            self.status = "OK"
             self.status_label.setText("OK")
             # Better contrast for OK status
-            self.status_label.setStyleSheet("""
-                color: #155724;
-                background-color: #d4edda;
-                padding: 15px;
-                border-radius: 8px;
-                font-weight: bold;
-                border: 1px solid #c3e6cb;
-            """)
-            self.message_text.setEnabled(False)
-            self.send_button.setEnabled(False)
-            self.message_group.setStyleSheet("QGroupBox { background-color: white; }")
+            self.status_label.setStyleSheet(status_ok_style)
+            self.message_group.setStyleSheet(message_group_style)
+
+    def _can_send_advice(self):
+        """Return True if the patient on screen is the selected one and in warning"""
+        return (
+            self._displayed_patient is not None
+            and self._displayed_patient == self.selected_patient
+            and self.status is Status.WARNING
+        )
+
+    def update_advice_controls(self):
+        """Enable advice only for a selected patient whose readings are on screen"""
+        can_send = self._can_send_advice()
+        self.message_text.setEnabled(can_send)
+        # A send in progress keeps the button disabled until it finishes
+        self.send_button.setEnabled(can_send and not self._sending)
 
     def send_message(self):
         """Send a clinical advice message to the patient"""
-        if not self.current_patient or self.status != "Warning":
+        if self._sending or not self._can_send_advice():
             return
 
         message = self.message_text.toPlainText().strip()
@@ -254,49 +378,68 @@ class RPMApp(QMainWindow):
             msg.exec_()
             return
 
+        self._sending = True
+        # The readings the clinician is responding to belong to the displayed
+        # patient, which may differ from the one currently being fetched
+        self._message_patient = self._displayed_patient
+        self.send_button.setEnabled(False)
+        self.send_button.setText("Sending...")
+        self.status_bar.showMessage("Sending message...")
+
+        worker = ApiWorker(send_patient_message, self._message_patient, message)
+        worker.signals.finished.connect(self._on_send_done)
+        worker.signals.error.connect(self._on_send_error)
+        self.thread_pool.start(worker)
+
+    def _finish_send(self):
+        """Allow another send once the outcome of the last one was reported"""
+        self._sending = False
+        self.send_button.setText("Send Advice")
+        self.update_advice_controls()
+
+    def _on_send_done(self, result):
+        """Report the outcome of a sent message"""
         try:
-            self.send_button.setEnabled(False)
-            self.send_button.setText("Sending...")
-            self.status_bar.showMessage("Sending message...")
-
-            result = send_patient_message(self.current_patient, message)
-
-            if result.get("stored", False):
-                msg = UIComponents.create_message_box(
-                    self,
-                    "Success",
-                    "Message Sent Successfully",
-                    f"Clinical advice has been sent to Patient {self.current_patient}."
-                )
-                msg.exec_()
-
-                self.message_text.clear()
-                self.status_bar.showMessage("Message sent successfully")
-            else:
+            stored = result.get("stored", False)
+        except Exception as e:
+            self._on_send_error(str(e))
+            return
 
-                msg = UIComponents.create_message_box(
-                    self,
-                    "Warning",
-                    "Message Not Stored",
-                    "The server received the message but did not confirm storage.",
-                    QMessageBox.Icon.Warning
-                )
-                msg.exec_()
-                self.status_bar.showMessage("Message received but not confirmed stored")
+        if stored:
+            msg = UIComponents.create_message_box(
+                self,
+                "Success",
+                "Message Sent Successfully",
+                f"Clinical advice has been sent to Patient {self._message_patient}."
+            )
+            msg.exec_()
 
-            self.send_button.setText("Send Advice")
-            self.send_button.setEnabled(True)
+            self.message_text.clear()
+            self.status_bar.showMessage("Message sent successfully")
+        else:
 
-        except Exception as e:
             msg = UIComponents.create_message_box(
                 self,
-                "Error",
-                "Could not send message",
-                str(e),
-                QMessageBox.Icon.Critical
+                "Warning",
+                "Message Not Stored",
+                "The server received the message but did not confirm storage.",
+                QMessageBox.Icon.Warning
             )
             msg.exec_()
-
-            self.send_button.setText("Send Advice")
-            self.send_button.setEnabled(True)
-            self.status_bar.showMessage(f"Error sending message: {str(e)}")
+            self.status_bar.showMessage("Message received but not confirmed stored")
+
+        self._finish_send()
+
+    def _on_send_error(self, error):
+        """Report a failed message send"""
+        msg = UIComponents.create_message_box(
+            self,
+            "Error",
+            "Could not send message",
+            error,
+            QMessageBox.Icon.Critical
+        )
+        msg.exec_()
+
+        self._finish_send()
+        self.status_bar.showMessage(f"Error sending message: {error}")
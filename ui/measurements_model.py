@@ -0,0 +1,130 @@
+"""
+Table model for the SpO2 readings of the Remote Patient Monitoring application
+"""
+
+import re
+from datetime import datetime
+from functools import lru_cache
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QBrush, QColor, QFont
+
+from config import SPO2_THRESHOLD
+
+
+# Month, day and HH:MM of an ISO 8601 timestamp such as 2024-05-01T10:05:00Z
+ISO_TIMESTAMP = re.compile(r"\d{4}-(\d{2})-(\d{2})T(\d{2}:\d{2})")
+
+
+@lru_cache(maxsize=12)
+def month_abbreviation(month):
+    """Return the locale's abbreviated name for a month number"""
+    return datetime(2000, month, 1).strftime("%b")
+
+
+@lru_cache(maxsize=512)
+def format_timestamp(timestamp):
+    """Format an ISO timestamp for the readings table"""
+    # The table shows the timestamp's own wall-clock time, so the fields can
+    # be sliced out without building a datetime
+    match = ISO_TIMESTAMP.match(timestamp)
+    if match:
+        month, day, time_of_day = match.groups()
+        return f"{time_of_day}, {day} {month_abbreviation(int(month))}"
+
+    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    return dt.strftime("%H:%M, %d %b")
+
+
+class MeasurementsModel(QAbstractTableModel):
+    """
+    Read-only model exposing SpO2 measurements to a QTableView
+    """
+
+    HEADERS = ["Time", "SpO2 (%)", "Status"]
+
+    # Status cell font, shared by every row
+    STATUS_FONT = QFont("", -1, QFont.Bold)
+
+    # Status cell text, background and foreground, indexed by is_low
+    STATUS_CELLS = (
+        ("NORMAL", QBrush(QColor("#e8f5e9")), QBrush(QColor("#2e7d32"))),
+        ("LOW", QBrush(QColor("#ffebee")), QBrush(QColor("#d32f2f"))),
+    )
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # One (formatted time, SpO2 text, is_low) tuple per measurement
+        self._rows = []
+        self.has_low_reading = False
+
+    def set_measurements(self, measurements, first_row=0):
+        """
+        Load (timestamp, spo2) measurements into the model
+
+        When first_row equals the current row count, only the measurements
+        from first_row onwards are added and announced as inserted rows, so
+        the view lays out just the new rows. A full load with an unchanged row
+        count updates the rows in place; anything else resets the model.
+        """
+        append = 0 < first_row == len(self._rows)
+        if not append:
+            first_row = 0
+
+        rows = []
+        has_low_reading = self.has_low_reading if append else False
+
+        for timestamp, spo2 in measurements[first_row:]:
+            is_low = spo2 < SPO2_THRESHOLD
+            has_low_reading = has_low_reading or is_low
+            rows.append((format_timestamp(timestamp), str(spo2), is_low))
+
+        if append:
+            if rows:
+                self.beginInsertRows(QModelIndex(), first_row, first_row + len(rows) - 1)
+                self._rows.extend(rows)
+                self.endInsertRows()
+        elif rows and len(rows) == len(self._rows):
+            self._rows = rows
+            self.dataChanged.emit(self.index(0, 0), self.index(len(rows) - 1, len(self.HEADERS) - 1))
+        else:
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+
+        self.has_low_reading = has_low_reading
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        time_text, spo2_text, is_low = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return time_text
+            if column == 1:
+                return spo2_text
+            return self.STATUS_CELLS[is_low][0]
+
+        if column == 2:
+            if role == Qt.FontRole:
+                return self.STATUS_FONT
+            if role == Qt.BackgroundRole:
+                return self.STATUS_CELLS[is_low][1]
+            if role == Qt.ForegroundRole:
+                return self.STATUS_CELLS[is_low][2]
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
@@ -3,6 +3,221 @@ UI styles for the Remote Patient Monitoring application
 """
 
 
+application_styles = """
+    QMainWindow {
+        background-color: #f0f2f5;
+    }
+    QLabel {
+        color: #1a1a1a;
+    }
+    QPushButton {
+        background-color: #1a1a1a;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 12px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #9b9d9f;
+    }
+    QPushButton:disabled {
+        background-color: #9b9d9f;
+        color: #555555;
+    }
+    QComboBox {
+        border: 1px solid #ced4da;
+        border-radius: 8px;
+        padding: 5px;
+        background-color: white;
+        color: #1a1a1a;
+        min-width: 150px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: white;
+        color: #1a1a1a;
+        selection-background-color: #7bb9ff;
+        selection-color: black;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #d1d9e6;
+        border-radius: 10px;
+        margin-top: 12px;
+        background-color: white;
+        color: #1a1a1a;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+        color: #1a1a1a;
+    }
+    QTableView {
+        border: none;
+        gridline-color: #e9ecef;
+        background-color: white;
+        color: #1a1a1a;
+        alternate-background-color: #f8f9fa;  /* Alternating row colors */
+    }
+    QTableView::item {
+        padding: 5px;
+        border: none;
+        background-color: inherit !important;
+    }
+    QHeaderView::section {
+        background-color: #f8f9fa;
+        color: #1a1a1a;
+        padding: 8px;
+        font-weight: bold;
+        border: none;
+        border-bottom: 1px solid #dee2e6;
+    }
+    QTextEdit {
+        border: 1px solid #ced4da;
+        border-radius: 8px;
+        padding: 5px;
+        background-color: white;
+        color: #1a1a1a;
+    }
+    QScrollBar:vertical {
+        border: none;
+        background: #f8f9fa;
+        width: 8px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #adb5bd;
+        min-height: 20px;
+        border-radius: 4px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        border: none;
+        background: none;
+    }
+    QStatusBar {
+        background-color: #f8f9fa;
+        color: #495057;
+    }
+    QLabel#titleLabel {
+        color: #051d40;
+    }
+    QLabel#subtitleLabel, QLabel#messageInfo {
+        color: #6c757d;
+    }
+    #selectionArea, #selectionArea QWidget {
+        background-color: #f8f9fa;
+        border-radius: 8px;
+        border: 1px solid #e9ecef;
+    }
+    QComboBox#patientCombo {
+        border: 1px solid #ced4da;
+        border-radius: 0px;
+        padding: 1px 18px 1px 3px;
+        background-color: white;
+        color: #1a1a1a;
+        min-width: 150px;
+        font-size: 11px;
+        combobox-popup: 0;
+    }
+    QComboBox#patientCombo::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 20px;
+        border-left: 1px solid #ced4da;
+    }
+    QComboBox#patientCombo QAbstractItemView {
+        border: 1px solid #ced4da;
+        selection-background-color: #e9ecef;
+        selection-color: #212121;
+        background-color: white;
+        color: #1a1a1a;
+        font-size: 11px;
+        outline: 0;
+        padding: 0px 2px;  /* Kein Padding oben/unten, nur links/rechts */
+        margin: 0px;
+        border-radius: 0px;
+    }
+    QComboBox#patientCombo QAbstractItemView::item {
+        background-color: white;
+        color: #1a1a1a;
+        padding: 2px 5px;
+        margin: 0px;
+        border: none;
+        height: 18px;
+        min-height: 18px;
+    }
+    QComboBox#patientCombo QAbstractItemView::item:selected {
+        background-color: #e9ecef;
+        color: #212121;
+    }
+    QPushButton#refreshButton {
+        background-color: #0d6efd;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton#refreshButton:hover {
+        background-color: #0b5ed7;
+    }
+    QPushButton#refreshButton:disabled {
+        background-color: #8cadf3;
+        color: #ffffff;
+    }
+    QFrame#headerSeparator {
+        background-color: #dee2e6;
+        margin-top: 5px;
+        margin-bottom: 5px;
+    }
+    QLabel#patientInfo {
+        background-color: #e8f4ff;
+        padding: 10px;
+        border-radius: 8px;
+        border: 1px solid #c8e1ff;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#sendButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-size: 14px;
+    }
+    QPushButton#sendButton:hover {
+        background-color: #45A049;
+    }
+    QPushButton#sendButton:disabled {
+        background-color: #CCCCCC;
+        color: #666666;
+    }
+    QMessageBox {
+        background-color: white;
+    }
+    QMessageBox QPushButton,
+    QMessageBox QPushButton:hover,
+    QMessageBox QPushButton:disabled {
+        background-color: #7bb9ff;
+        color: black;
+        border: none;
+        padding: 6px 12px;
+        border-radius: 12px;
+    }
+    QMessageBox[severity="critical"] QPushButton,
+    QMessageBox[severity="critical"] QPushButton:hover,
+    QMessageBox[severity="critical"] QPushButton:disabled,
+    QMessageBox[severity="warning"] QPushButton,
+    QMessageBox[severity="warning"] QPushButton:hover,
+    QMessageBox[severity="warning"] QPushButton:disabled {
+        background-color: #1a1a1a;
+        color: white;
+    }
+"""
+
+
 def get_application_styles():
     """
     Returns the stylesheet for the application
@@ -10,103 +225,7 @@ def get_application_styles():
     Returns:
         str: CSS-like stylesheet for Qt
     """
-    return """
-        QMainWindow {
-            background-color: #f0f2f5;
-        }
-        QLabel {
-            color: #1a1a1a;
-        }
-        QPushButton {
-            background-color: #1a1a1a;
-            color: white;
-            border: none;
-            padding: 8px 16px;
-            border-radius: 12px;
-            font-weight: bold;
-        }
-        QPushButton:hover {
-            background-color: #9b9d9f;
-        }
-        QPushButton:disabled {
-            background-color: #9b9d9f;
-            color: #555555;
-        }
-        QComboBox {
-            border: 1px solid #ced4da;
-            border-radius: 8px;
-            padding: 5px;
-            background-color: white;
-            color: #1a1a1a;
-            min-width: 150px;
-        }
-        QComboBox QAbstractItemView {
-            background-color: white;
-            color: #1a1a1a;
-            selection-background-color: #7bb9ff;
-            selection-color: black;
-        }
-        QGroupBox {
-            font-weight: bold;
-            border: 1px solid #d1d9e6;
-            border-radius: 10px;
-            margin-top: 12px;
-            background-color: white;
-            color: #1a1a1a;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px;
-            color: #1a1a1a;
-        }
-        QTableWidget {
-            border: none;
-            gridline-color: #e9ecef;
-            background-color: white;
-            color: #1a1a1a;
-            alternate-background-color: #f8f9fa;  /* Alternating row colors */
-        }
-        QTableWidget::item {
-            padding: 5px;
-            border: none;
-            background-color: inherit !important;
-        }
-        QHeaderView::section {
-            background-color: #f8f9fa;
-            color: #1a1a1a;
-            padding: 8px;
-            font-weight: bold;
-            border: none;
-            border-bottom: 1px solid #dee2e6;
-        }
-        QTextEdit {
-            border: 1px solid #ced4da;
-            border-radius: 8px;
-            padding: 5px;
-            background-color: white;
-            color: #1a1a1a;
-        }
-        QScrollBar:vertical {
-            border: none;
-            background: #f8f9fa;
-            width: 8px;
-            margin: 0px;
-        }
-        QScrollBar::handle:vertical {
-            background: #adb5bd;
-            min-height: 20px;
-            border-radius: 4px;
-        }
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            border: none;
-            background: none;
-        }
-        QStatusBar {
-            background-color: #f8f9fa;
-            color: #495057;
-        }
-    """
+    return application_styles
 
 
 modern_light_theme = {
@@ -117,20 +236,56 @@ modern_light_theme = {
     "border": "#E0E0E0"
 }
 
-button_style = """
-    QPushButton {
-        background-color: #4CAF50;
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 8px 16px;
-        font-size: 14px;
+status_unknown_style = """
+    color: #6c757d;
+    background-color: #f8f9fa;
+    padding: 10px;
+    border-radius: 8px;
+"""
+
+status_ok_style = """
+    color: #155724;
+    background-color: #d4edda;
+    padding: 15px;
+    border-radius: 8px;
+    font-weight: bold;
+    border: 1px solid #c3e6cb;
+"""
+
+status_warning_style = """
+    color: #721c24;
+    background-color: #f8d7da;
+    padding: 15px;
+    border-radius: 8px;
+    font-weight: bold;
+    border: 1px solid #f5c6cb;
+"""
+
+message_group_style = "QGroupBox { background-color: white; }"
+
+message_group_warning_style = """
+    QGroupBox {
+        background-color: #fff8f8;
+        border: 1px solid #f5c6cb;
     }
-    QPushButton:hover {
-        background-color: #45A049;
+    QGroupBox::title {
+        color: #721c24;
     }
-    QPushButton:disabled {
-        background-color: #CCCCCC;
-        color: #666666;
+"""
+
+patient_info_error_style = """
+    background-color: #ffebee;
+    padding: 10px;
+    border-radius: 8px;
+    border: 1px solid #ffcdd2;
+    font-size: 14px;
+    font-weight: bold;
+    color: #d32f2f;
+"""
+
+table_item_style = """
+    QTableView::item {
+        background-color: transparent !important;
+        border: none;
     }
 """
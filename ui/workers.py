@@ -0,0 +1,33 @@
+"""
+Background workers for the Remote Patient Monitoring application
+"""
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by an ApiWorker once its call has completed
+    """
+    finished = Signal(object)
+    error = Signal(str)
+
+
+class ApiWorker(QRunnable):
+    """
+    Runs a blocking API call on a thread pool thread so the GUI stays responsive
+    """
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)